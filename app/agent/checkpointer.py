@@ -2,24 +2,55 @@
 
 Provides conversation memory across requests using database persistence.
 
-NOTE: Checkpointing is currently disabled due to connection management complexity.
-This will be properly implemented in a future update.
+Checkpoint reads/writes go through AsyncPostgresSaver backed by a shared
+psycopg AsyncConnectionPool, so they never block the event loop and reuse
+pooled connections instead of reconnecting per request.
 """
 
 from typing import Optional
 
-from langgraph.checkpoint.base import BaseCheckpointSaver
+from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
+from psycopg_pool import AsyncConnectionPool
 
+from app.config import settings
 
-async def get_checkpointer() -> Optional[BaseCheckpointSaver]:
+# Process-wide connection pool shared by all checkpoint operations
+_pool: Optional[AsyncConnectionPool] = None
+
+
+async def create_checkpointer() -> AsyncPostgresSaver:
     """
-    Get PostgreSQL checkpointer for LangGraph.
-    
-    Currently returns None (checkpointing disabled).
-    
+    Create the PostgreSQL checkpointer backed by the shared async pool.
+
+    Opens the process-wide connection pool on first call and applies the
+    checkpoint table migrations once at startup, not per request.
+
     Returns:
-        None (checkpointing disabled for now)
+        AsyncPostgresSaver ready to be passed to the agent graph.
     """
-    # TODO: Implement proper async checkpointer with connection pooling
-    # For now, return None to disable checkpointing
-    return None
+    global _pool
+
+    if _pool is None:
+        # AsyncPostgresSaver talks psycopg, so strip the asyncpg driver marker
+        conninfo = settings.database_url.replace("+asyncpg", "")
+        _pool = AsyncConnectionPool(
+            conninfo=conninfo,
+            min_size=settings.checkpointer_pool_min_size,
+            max_size=settings.checkpointer_pool_max_size,
+            open=False,
+            kwargs={"autocommit": True, "prepare_threshold": 0},
+        )
+        await _pool.open()
+
+    checkpointer = AsyncPostgresSaver(_pool)
+    await checkpointer.setup()
+    return checkpointer
+
+
+async def close_checkpointer() -> None:
+    """Close the shared checkpointer connection pool."""
+    global _pool
+
+    if _pool is not None:
+        await _pool.close()
+        _pool = None
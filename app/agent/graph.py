@@ -3,53 +3,75 @@
 Creates the agent graph with nodes and edges for the ReAct pattern.
 """
 
+import hashlib
+from functools import lru_cache
 from typing import Optional
 
+from langgraph.cache.memory import InMemoryCache
 from langgraph.checkpoint.base import BaseCheckpointSaver
-from langgraph.graph import END, StateGraph
+from langgraph.graph import StateGraph
+from langgraph.types import CachePolicy
 
-from app.agent.nodes import call_model, create_tool_node, should_continue
+from app.agent.nodes import call_model, execute_tools
 from app.agent.state import AgentState
+from app.config import settings
 
 
+def _agent_cache_key(state: AgentState) -> bytes:
+    """
+    Build the cache key for the agent node from the message history.
+
+    Identical histories (retries, duplicate submits) hash to the same key,
+    so repeat inputs short-circuit to the cached AIMessage instead of
+    paying another LLM round trip.
+    """
+    fingerprint = repr(
+        [(m.type, m.content, getattr(m, "tool_calls", None)) for m in state.messages]
+    )
+    return hashlib.blake2b(fingerprint.encode()).digest()
+
+
+@lru_cache(maxsize=4)
 def create_agent_graph(checkpointer: Optional[BaseCheckpointSaver] = None):
     """
     Create the LangGraph agent workflow.
-    
+
+    The compiled graph is cached per checkpointer, so repeated calls
+    (one per request today) reuse the already-built Pregel runtime
+    instead of re-walking and re-validating the node/edge registry.
+
     The graph follows a ReAct (Reasoning + Acting) pattern:
     1. LLM decides what to do (call_model)
     2. If tools needed, execute them (tools)
     3. Return to LLM with tool results
     4. Repeat until task is complete
-    
+
     Args:
         checkpointer: Optional checkpointer for conversation memory
-    
+
     Returns:
         Compiled StateGraph ready for execution.
     """
     # Create the graph
     workflow = StateGraph(AgentState)
-    
-    # Add nodes
-    workflow.add_node("agent", call_model)
-    workflow.add_node("tools", create_tool_node())
-    
-    # Set entry point
-    workflow.set_entry_point("agent")
-    
-    # Add conditional edges
-    workflow.add_conditional_edges(
+
+    # Add nodes. The agent node is cached by message-history digest so
+    # replayed prompts skip the LLM call; the tools node is never cached
+    # because tool execution has side effects.
+    workflow.add_node(
         "agent",
-        should_continue,
-        {
-            "continue": "tools",
-            "end": END,
-        },
+        call_model,
+        cache_policy=CachePolicy(key_func=_agent_cache_key, ttl=settings.agent_cache_ttl),
     )
-    
-    # Add edge from tools back to agent
+    workflow.add_node("tools", execute_tools)
+
+    # Set entry point
+    workflow.set_entry_point("agent")
+
+    # Routing out of the agent node comes from the Command returned by
+    # call_model (one checkpoint write per step); only the static edge
+    # from tools back to the agent remains.
     workflow.add_edge("tools", "agent")
-    
-    # Compile the graph with optional checkpointer
-    return workflow.compile(checkpointer=checkpointer)
+
+    # Compile the graph with optional checkpointer and node cache
+    return workflow.compile(checkpointer=checkpointer, cache=InMemoryCache())
@@ -3,10 +3,15 @@
 Each node represents a step in the agent's reasoning process.
 """
 
+import asyncio
 import logging
+from functools import lru_cache
 
 from langchain_core.messages import AIMessage, ToolMessage
-from langgraph.prebuilt import ToolNode
+from langchain_core.tools import tool
+from langchain_core.utils.function_calling import convert_to_openai_tool
+from langgraph.graph import END
+from langgraph.types import Command
 
 from app.agent.state import AgentState
 from app.config import settings
@@ -16,179 +21,196 @@ from app.mcp.tools import todo_simple as todo  # Use simple in-memory TODO for a
 
 logger = logging.getLogger(__name__)
 
+__all__ = ["call_model", "execute_tools", "should_continue"]
 
-def create_tool_node() -> ToolNode:
+
+# Tools are wrapped once at import time: @tool builds a Pydantic schema for
+# each function (signature reflection, docstring parsing, JSON-schema build),
+# which is too expensive to repeat per request.
+@tool
+def add_todo_tool(task: str) -> dict:
+    """Add a new TODO item to the list."""
+    return todo.add_todo(task)
+
+
+@tool
+def list_todos_tool() -> list:
+    """Get all TODO items."""
+    return todo.list_todos()
+
+
+@tool
+def complete_todo_tool(todo_id: int) -> dict:
+    """Mark a TODO item as completed."""
+    return todo.complete_todo(todo_id)
+
+
+@tool
+def delete_todo_tool(todo_id: int) -> dict:
+    """Delete a TODO item."""
+    return todo.delete_todo(todo_id)
+
+
+@tool
+async def calculate_tool(expression: str) -> dict:
+    """
+    Safely evaluate a mathematical expression.
+    Supports: +, -, *, /, ^ (power)
+    Example: "2 + 2" or "10 * 5 - 3"
+    """
+    # Parse/eval is CPU-bound; run it off the loop so a pathological
+    # expression can't stall token streaming for other sessions
+    return await asyncio.to_thread(calculator.calculate, expression)
+
+
+@tool
+async def get_weather_tool(city: str) -> dict:
+    """
+    Get current weather for a city.
+    Example: "London", "New York", "Tokyo"
+    """
+    if not settings.weather_api_key:
+        return {"error": "Weather API key not configured"}
+    return await weather.get_weather(city, settings.weather_api_key)
+
+
+_TOOLS = [
+    add_todo_tool,
+    list_todos_tool,
+    complete_todo_tool,
+    delete_todo_tool,
+    calculate_tool,
+    get_weather_tool,
+]
+
+# OpenAI-format tool specs serialized once; binding plain dicts lets
+# LangChain skip the inspect-based conversion on every bind
+_TOOL_SPECS = [convert_to_openai_tool(t) for t in _TOOLS]
+
+_TOOLS_BY_NAME = {t.name: t for t in _TOOLS}
+
+# Cap concurrent tool executions across requests so a burst of tool-heavy
+# turns can't exhaust sockets or worker threads
+_TOOL_CONCURRENCY = asyncio.Semaphore(8)
+
+
+async def execute_tools(state: AgentState) -> dict:
     """
-    Create a ToolNode with all available MCP tools.
-    
+    Execute all tool calls from the last AI message concurrently.
+
+    Tool calls within one LLM turn share no state, so they run as a
+    TaskGroup: the turn costs max() of the individual latencies instead
+    of their sum (the weather HTTP call dominates mixed turns). Each
+    call is bounded by mcp_timeout and a shared concurrency semaphore.
+
+    Args:
+        state: Current agent state; the last message carries tool_calls.
+
     Returns:
-        Configured ToolNode instance.
+        Updated state with one ToolMessage per tool call, in call order.
     """
-    # Import LangChain tool wrapper
-    from langchain_core.tools import tool
-    
-    # Wrap MCP tools as LangChain tools
-    @tool
-    def add_todo_tool(task: str) -> dict:
-        """Add a new TODO item to the list."""
-        return todo.add_todo(task)
-    
-    @tool
-    def list_todos_tool() -> list:
-        """Get all TODO items."""
-        return todo.list_todos()
-    
-    @tool
-    def complete_todo_tool(todo_id: int) -> dict:
-        """Mark a TODO item as completed."""
-        return todo.complete_todo(todo_id)
-    
-    @tool
-    def delete_todo_tool(todo_id: int) -> dict:
-        """Delete a TODO item."""
-        return todo.delete_todo(todo_id)
-    
-    @tool
-    def calculate_tool(expression: str) -> dict:
-        """
-        Safely evaluate a mathematical expression.
-        Supports: +, -, *, /, ^ (power)
-        Example: "2 + 2" or "10 * 5 - 3"
-        """
-        return calculator.calculate(expression)
-    
-    @tool
-    async def get_weather_tool(city: str) -> dict:
-        """
-        Get current weather for a city.
-        Example: "London", "New York", "Tokyo"
-        """
-        if not settings.weather_api_key:
-            return {"error": "Weather API key not configured"}
-        return await weather.get_weather(city, settings.weather_api_key)
-    
-    # Create list of tools
-    tools = [
-        add_todo_tool,
-        list_todos_tool,
-        complete_todo_tool,
-        delete_todo_tool,
-        calculate_tool,
-        get_weather_tool,
-    ]
-    
-    return ToolNode(tools)
-
-
-async def call_model(state: AgentState) -> dict:
+    tool_calls = getattr(state.messages[-1], "tool_calls", None) or []
+
+    async def _run(tool_call: dict) -> ToolMessage:
+        name = tool_call["name"]
+        # Lookup stays outside the try so a KeyError raised inside a
+        # tool's own body isn't misreported as an unknown tool name
+        selected_tool = _TOOLS_BY_NAME.get(name)
+        if selected_tool is None:
+            result = f"Error: unknown tool '{name}'"
+        else:
+            try:
+                async with _TOOL_CONCURRENCY:
+                    result = await asyncio.wait_for(
+                        selected_tool.ainvoke(tool_call.get("args", {})),
+                        timeout=settings.mcp_timeout,
+                    )
+            except asyncio.TimeoutError:
+                result = f"Error: tool '{name}' timed out after {settings.mcp_timeout}s"
+            except Exception as e:
+                result = f"Error: {e}"
+        return ToolMessage(
+            content=str(result),
+            name=name,
+            tool_call_id=tool_call.get("id", ""),
+        )
+
+    # _run swallows per-tool failures into the ToolMessage, so the group
+    # never aborts sibling calls
+    async with asyncio.TaskGroup() as tg:
+        tasks = [tg.create_task(_run(tool_call)) for tool_call in tool_calls]
+
+    return {"messages": [task.result() for task in tasks]}
+
+
+@lru_cache(maxsize=1)
+def _bound_llm():
+    """Get the LLM with tools bound, built once and reused across requests."""
+    return get_llm().bind(tools=_TOOL_SPECS, tool_choice="auto")
+
+
+async def call_model(state: AgentState) -> Command:
     """
     Call the LLM to decide the next action.
-    
+
+    Returns a Command combining the state update with the routing
+    decision, so each agent step costs one checkpoint write instead of
+    two (node update + conditional-edge transition).
+
     Args:
         state: Current agent state with conversation history.
-        
+
     Returns:
-        Updated state with LLM response.
+        Command with the LLM response and the next node to run.
     """
-    # Get LLM with tools bound
-    from langchain_core.tools import tool
-    
-    # Wrap tools for binding
-    @tool
-    def add_todo_tool(task: str) -> dict:
-        """Add a new TODO item to the list."""
-        return todo.add_todo(task)
-    
-    @tool
-    def list_todos_tool() -> list:
-        """Get all TODO items."""
-        return todo.list_todos()
-    
-    @tool
-    def complete_todo_tool(todo_id: int) -> dict:
-        """Mark a TODO item as completed."""
-        return todo.complete_todo(todo_id)
-    
-    @tool
-    def delete_todo_tool(todo_id: int) -> dict:
-        """Delete a TODO item."""
-        return todo.delete_todo(todo_id)
-    
-    @tool
-    def calculate_tool(expression: str) -> dict:
-        """
-        Safely evaluate a mathematical expression.
-        Supports: +, -, *, /, ^ (power)
-        Example: "2 + 2" or "10 * 5 - 3"
-        """
-        return calculator.calculate(expression)
-    
-    @tool
-    async def get_weather_tool(city: str) -> dict:
-        """
-        Get current weather for a city.
-        Example: "London", "New York", "Tokyo"
-        """
-        if not settings.weather_api_key:
-            return {"error": "Weather API key not configured"}
-        return await weather.get_weather(city, settings.weather_api_key)
-    
-    tools = [
-        add_todo_tool,
-        list_todos_tool,
-        complete_todo_tool,
-        delete_todo_tool,
-        calculate_tool,
-        get_weather_tool,
-    ]
-    
     try:
-        llm = get_llm()
-        llm_with_tools = llm.bind_tools(tools)
-        
-        # Log the input messages
-        logger.info(f"Calling LLM with {len(state['messages'])} messages")
-        logger.debug(f"Messages: {state['messages']}")
-        
-        # Call LLM
-        response = await llm_with_tools.ainvoke(state["messages"])
-        
-        # Log the response
-        logger.info(f"LLM response type: {type(response)}")
-        logger.info(f"LLM response content: {response.content if hasattr(response, 'content') else 'No content'}")
-        logger.info(f"LLM response tool_calls: {response.tool_calls if hasattr(response, 'tool_calls') else 'No tool_calls'}")
-        
+        # Lazy %-formatting: the message reprs are only built when the
+        # level is actually enabled, not on every call
+        logger.info("Calling LLM with %d messages", len(state.messages))
+        logger.debug("Messages: %r", state.messages)
+
+        # Call LLM (tools are bound once and cached)
+        response = await _bound_llm().ainvoke(state.messages)
+
+        logger.debug(
+            "LLM response: content=%r tool_calls=%r",
+            getattr(response, "content", None),
+            getattr(response, "tool_calls", None),
+        )
+
         # Check if response is empty
         if not response.content and (not hasattr(response, 'tool_calls') or not response.tool_calls):
             logger.error("LLM returned empty response!")
             # Return a default response to avoid the error
-            from langchain_core.messages import AIMessage
-            return {"messages": [AIMessage(content="I apologize, but I encountered an issue processing your request. Please try again.")]}
-        
-        return {"messages": [response]}
-    
+            return Command(
+                update={"messages": [AIMessage(content="I apologize, but I encountered an issue processing your request. Please try again.")]},
+                goto=END,
+            )
+
+        return Command(
+            update={"messages": [response]},
+            goto="tools" if getattr(response, "tool_calls", None) else END,
+        )
+
     except Exception as e:
         logger.error(f"Error in call_model: {e}", exc_info=True)
-        from langchain_core.messages import AIMessage
-        return {"messages": [AIMessage(content=f"Error: {str(e)}")]}
+        return Command(update={"messages": [AIMessage(content=f"Error: {str(e)}")]}, goto=END)
 
 
 def should_continue(state: AgentState) -> str:
     """
     Determine if the agent should continue or finish.
-    
+
+    Routing now happens via the Command returned by call_model; this
+    helper is kept for callers that inspect the state directly.
+
     Args:
         state: Current agent state.
-        
+
     Returns:
         "continue" if tools should be called, "end" otherwise.
     """
-    messages = state["messages"]
-    last_message = messages[-1]
-    
-    # If the last message has tool calls, continue to tools
-    if hasattr(last_message, "tool_calls") and last_message.tool_calls:
-        return "continue"
-    
-    # Otherwise, end the workflow
-    return "end"
+    # getattr probe instead of hasattr: hasattr is try/except under the
+    # hood and this runs on every graph super-step
+    tool_calls = getattr(state.messages[-1], "tool_calls", None)
+    return "continue" if tool_calls else "end"
@@ -1,14 +1,21 @@
 """Agent state schema for LangGraph workflow."""
 
-from typing import Annotated, Sequence
+from dataclasses import dataclass, field
+from typing import Annotated
 
 from langchain_core.messages import BaseMessage
 from langgraph.graph.message import add_messages
-from typing_extensions import TypedDict
 
 
-class AgentState(TypedDict):
-    """State schema for the agent graph."""
-    
-    messages: Annotated[Sequence[BaseMessage], add_messages]
-    session_id: str  # For conversation memory
+@dataclass(slots=True)
+class AgentState:
+    """State schema for the agent graph.
+
+    A slotted dataclass rather than a TypedDict: LangGraph supports
+    dataclass state schemas directly, and slots avoid allocating a
+    per-instance __dict__ on every super-step. The add_messages reducer
+    still applies through the Annotated metadata.
+    """
+
+    messages: Annotated[list[BaseMessage], add_messages] = field(default_factory=list)
+    session_id: str = ""  # For conversation memory
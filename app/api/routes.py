@@ -2,12 +2,13 @@
 
 import logging
 import uuid
-from typing import AsyncGenerator
+from functools import lru_cache
+from typing import Annotated, AsyncGenerator
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
 from langchain_core.messages import HumanMessage
 from sqlalchemy.ext.asyncio import AsyncSession
-from sse_starlette.sse import EventSourceResponse
 
 from app.agent.graph import create_agent_graph
 from app.api.schemas import ChatRequest, ChatResponse, HealthResponse
@@ -20,14 +21,44 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Built once; the health payload never changes, so there is no reason to
+# re-validate a fresh model instance per request
+_HEALTH_RESPONSE = HealthResponse(status="healthy", version="0.1.0")
+
+
+# Built once at import; rejects empty/oversized messages in FastAPI's
+# validation layer before any agent machinery is touched
+MessageQ = Annotated[str, Query(min_length=1, max_length=4096, description="User message")]
+
+
+@lru_cache(maxsize=4096)
+def _session_config(session_id: str) -> dict:
+    """Runnable config for a session, cached so active sessions reuse it."""
+    return {"configurable": {"thread_id": session_id}}
+
+
+def _get_agent_graph(request: Request):
+    """
+    Agent graph prebuilt at startup, from app state.
+
+    Falls back to the (cached) factory for apps whose lifespan has not
+    run, e.g. test clients constructed without a startup phase.
+    """
+    graph = getattr(request.app.state, "agent_graph", None)
+    if graph is None:
+        graph = create_agent_graph(
+            checkpointer=getattr(request.app.state, "checkpointer", None)
+        )
+    return graph
+
 
 @router.get("/health", response_model=HealthResponse)
 async def health_check():
     """Health check endpoint."""
-    return HealthResponse(status="healthy", version="0.1.0")
+    return _HEALTH_RESPONSE
 
 
-@router.post("/chat", response_model=ChatResponse)
+@router.post("/chat", response_model=ChatResponse, response_model_exclude_none=True)
 @limiter.limit("100/minute")
 async def chat(
     request: Request,
@@ -43,24 +74,21 @@ async def chat(
     Supports conversation memory via session_id.
     """
     try:
-        # Get checkpointer from app state
-        checkpointer = request.app.state.checkpointer
-        
-        # Create agent graph with checkpointer
-        agent_graph = create_agent_graph(checkpointer=checkpointer)
-        
+        # Graph is compiled once at startup and shared across requests
+        agent_graph = _get_agent_graph(request)
+
         # Generate or use provided session ID for conversation memory
-        session_id = chat_request.session_id or str(uuid.uuid4())
-        
+        # (uuid4().hex skips the dashed-string formatting)
+        session_id = chat_request.session_id or uuid.uuid4().hex
+
         # Prepare initial state
         initial_state = {
             "messages": [HumanMessage(content=chat_request.message)],
             "session_id": session_id,
         }
-        
+
         # Run the agent with checkpointing
-        config = {"configurable": {"thread_id": session_id}}
-        result = await agent_graph.ainvoke(initial_state, config=config)
+        result = await agent_graph.ainvoke(initial_state, config=_session_config(session_id))
         
         # Extract response
         messages = result.get("messages", [])
@@ -95,41 +123,45 @@ async def chat(
 @limiter.limit("100/minute")
 async def chat_stream(
     request: Request,
-    message: str = Query(..., description="User message"),
+    message: MessageQ,
     session_id: str = Query(None, description="Session ID for conversation memory"),
     api_key: str = Depends(verify_api_key),
-) -> EventSourceResponse:
+) -> StreamingResponse:
     """
     Stream chat responses via Server-Sent Events.
-    
+
     Requires authentication if AUTH_ENABLED=true in config.
     Rate limited to prevent abuse.
     Supports conversation memory via session_id.
     """
-    async def event_generator() -> AsyncGenerator[str, None]:
+    async def event_generator() -> AsyncGenerator[bytes, None]:
         try:
-            # Get checkpointer from app state
-            checkpointer = request.app.state.checkpointer
-            
-            # Create agent graph with checkpointer
-            agent_graph = create_agent_graph(checkpointer=checkpointer)
-            
+            # Graph is compiled once at startup and shared across requests
+            agent_graph = _get_agent_graph(request)
+
             # Generate or use provided session ID
-            sid = session_id or str(uuid.uuid4())
-            
+            sid = session_id or uuid.uuid4().hex
+
             # Prepare initial state
             initial_state = {
                 "messages": [HumanMessage(content=message)],
                 "session_id": sid,
             }
-            
+
             # Stream agent execution
-            config = {"configurable": {"thread_id": sid}}
-            async for event in stream_agent_response(agent_graph, initial_state, config):
+            async for event in stream_agent_response(agent_graph, initial_state, _session_config(sid)):
                 yield event
         
         except Exception as e:
             logger.error(f"Error in streaming endpoint: {e}", exc_info=True)
-            yield f"event: error\ndata: {str(e)}\n\n"
-    
-    return EventSourceResponse(event_generator())
+            yield f"event: error\ndata: {str(e)}\n\n".encode()
+
+    return StreamingResponse(
+        event_generator(),
+        media_type="text/event-stream",
+        headers={
+            # Keep intermediaries from buffering or caching the event stream
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",
+        },
+    )
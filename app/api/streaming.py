@@ -1,39 +1,122 @@
 """Streaming utilities for Server-Sent Events (SSE).
 
 Provides async generators for streaming agent responses in real-time.
+
+Events are produced as pre-encoded bytes (orjson for the JSON payload)
+so the hot streaming path never pays Python-level json.dumps or the
+str -> bytes re-encode in the ASGI layer. Frames are coalesced into
+batched writes so bursty tool turns don't pay one ASGI send + TCP frame
+per tiny event.
 """
 
-import json
-from typing import AsyncIterator
+import asyncio
+from typing import AsyncIterator, Optional
 
+import orjson
 from langchain_core.messages import AIMessage, ToolMessage
 
+from app.config import settings
+
 
 class StreamEventType:
-    """Event types for SSE streaming."""
-    
-    THOUGHT = "thought"
-    TOOL_CALL = "tool_call"
-    TOOL_RESULT = "tool_result"
-    ANSWER = "answer"
-    ERROR = "error"
-    DONE = "done"
+    """Event types for SSE streaming, pre-encoded for the wire."""
+
+    THOUGHT = b"thought"
+    TOOL_CALL = b"tool_call"
+    TOOL_RESULT = b"tool_result"
+    ANSWER = b"answer"
+    ERROR = b"error"
+    DONE = b"done"
 
 
-async def stream_agent_response(graph, input_data: dict) -> AsyncIterator[str]:
+async def stream_agent_response(
+    graph,
+    input_data: dict,
+    config: Optional[dict] = None,
+) -> AsyncIterator[bytes]:
     """
     Stream agent execution events via Server-Sent Events.
-    
+
+    A producer task drains the graph while this generator flushes the
+    accumulated frames whenever the buffer reaches stream_flush_bytes or
+    stream_flush_ms has elapsed, whichever comes first.
+
+    Args:
+        graph: Compiled LangGraph workflow
+        input_data: Input data for the agent
+        config: Optional runnable config (e.g. thread_id for checkpointing)
+
+    Yields:
+        One or more coalesced SSE event frames as bytes
+    """
+    queue: asyncio.Queue[Optional[bytes]] = asyncio.Queue()
+
+    async def _produce() -> None:
+        try:
+            async for frame in _agent_events(graph, input_data, config):
+                await queue.put(frame)
+        finally:
+            await queue.put(None)  # Sentinel: no more frames
+
+    producer = asyncio.create_task(_produce())
+    loop = asyncio.get_running_loop()
+    flush_interval = settings.stream_flush_ms / 1000
+    buf = bytearray()
+    last_flush = loop.time()
+    finished = False
+
+    try:
+        while not finished:
+            remaining = flush_interval - (loop.time() - last_flush)
+            if remaining <= 0 or len(buf) >= settings.stream_flush_bytes:
+                if buf:
+                    yield bytes(buf)
+                    buf.clear()
+                last_flush = loop.time()
+                continue
+
+            try:
+                frame = await asyncio.wait_for(queue.get(), timeout=remaining)
+            except asyncio.TimeoutError:
+                continue
+
+            # Drain whatever else the producer already queued so a burst of
+            # frames costs one buffer pass instead of one await per frame
+            while True:
+                if frame is None:
+                    finished = True
+                    break
+                buf += frame
+                try:
+                    frame = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+
+        if buf:
+            yield bytes(buf)
+    finally:
+        producer.cancel()
+
+
+async def _agent_events(
+    graph,
+    input_data: dict,
+    config: Optional[dict] = None,
+) -> AsyncIterator[bytes]:
+    """
+    Yield one SSE frame per agent/tool event from the graph.
+
     Args:
         graph: Compiled LangGraph workflow
         input_data: Input data for the agent
-        
+        config: Optional runnable config (e.g. thread_id for checkpointing)
+
     Yields:
-        SSE-formatted event strings
+        SSE-formatted event byte strings
     """
     try:
         # Stream events from the graph
-        async for event in graph.astream(input_data):
+        async for event in graph.astream(input_data, config=config):
             # Handle different event types
             for node_name, node_output in event.items():
                 if node_name == "agent":
@@ -41,43 +124,52 @@ async def stream_agent_response(graph, input_data: dict) -> AsyncIterator[str]:
                     messages = node_output.get("messages", [])
                     if messages:
                         last_message = messages[-1]
-                        
+
                         # Check if it's an AI message with tool calls
                         if isinstance(last_message, AIMessage):
-                            if hasattr(last_message, "tool_calls") and last_message.tool_calls:
-                                # Agent decided to call tools
+                            if getattr(last_message, "tool_calls", None):
+                                # Agent decided to call tools; frames are
+                                # assembled inline to keep the per-event
+                                # work to a single orjson.dumps call
                                 for tool_call in last_message.tool_calls:
-                                    yield format_sse_event(
-                                        StreamEventType.TOOL_CALL,
-                                        {
-                                            "name": tool_call.get("name"),
-                                            "args": tool_call.get("args"),
-                                        }
+                                    yield (
+                                        b"event: tool_call\ndata: "
+                                        + orjson.dumps(
+                                            {
+                                                "name": tool_call.get("name"),
+                                                "args": tool_call.get("args"),
+                                            }
+                                        )
+                                        + b"\n\n"
                                     )
                             elif last_message.content:
                                 # Agent has final answer
-                                yield format_sse_event(
-                                    StreamEventType.ANSWER,
-                                    {"content": last_message.content}
+                                yield (
+                                    b"event: answer\ndata: "
+                                    + orjson.dumps({"content": last_message.content})
+                                    + b"\n\n"
                                 )
-                
+
                 elif node_name == "tools":
                     # Tool execution results
                     messages = node_output.get("messages", [])
                     if messages:
                         for message in messages:
                             if isinstance(message, ToolMessage):
-                                yield format_sse_event(
-                                    StreamEventType.TOOL_RESULT,
-                                    {
-                                        "tool": message.name if hasattr(message, "name") else "unknown",
-                                        "result": message.content,
-                                    }
+                                yield (
+                                    b"event: tool_result\ndata: "
+                                    + orjson.dumps(
+                                        {
+                                            "tool": getattr(message, "name", None) or "unknown",
+                                            "result": message.content,
+                                        }
+                                    )
+                                    + b"\n\n"
                                 )
-        
+
         # Send done event
         yield format_sse_event(StreamEventType.DONE, {})
-        
+
     except Exception as e:
         # Send error event
         yield format_sse_event(
@@ -86,15 +178,15 @@ async def stream_agent_response(graph, input_data: dict) -> AsyncIterator[str]:
         )
 
 
-def format_sse_event(event_type: str, data: dict) -> str:
+def format_sse_event(event_type: bytes, data: dict) -> bytes:
     """
-    Format data as SSE event.
-    
+    Format data as an SSE event frame.
+
     Args:
-        event_type: Type of event
+        event_type: Pre-encoded event type (see StreamEventType)
         data: Event data
-        
+
     Returns:
-        SSE-formatted string
+        SSE-formatted byte string
     """
-    return f"event: {event_type}\ndata: {json.dumps(data)}\n\n"
+    return b"event: " + event_type + b"\ndata: " + orjson.dumps(data) + b"\n\n"
@@ -2,16 +2,70 @@
 
 This module provides a centralized way to create and configure LLM instances,
 supporting OpenRouter API with easy switching between models.
+
+All instances share one httpx.AsyncClient (HTTP/2 + keep-alive) so TLS
+handshakes and TCP sockets are reused across requests, and the ChatOpenAI
+objects themselves are cached per configuration.
 """
 
+from functools import lru_cache
+from typing import Optional
+
+import httpx
 from langchain_openai import ChatOpenAI
 
 from app.config import settings
 
+_OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1"
+
+_DEFAULT_HEADERS = {
+    "HTTP-Referer": "https://github.com/yourusername/fastapi-langgraph-mcp-starter",
+    "X-Title": "FastAPI LangGraph MCP Starter",
+}
+
+# Shared transport for all LLM calls
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Get the shared async HTTP client used by all LLM instances."""
+    global _http_client
+
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(
+            http2=True,
+            timeout=60.0,
+            limits=httpx.Limits(max_connections=256, max_keepalive_connections=64),
+        )
+    return _http_client
+
+
+async def aclose_http_client() -> None:
+    """Close the shared LLM HTTP client (called on app shutdown)."""
+    global _http_client
+
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+@lru_cache(maxsize=8)
+def _cached_chat_model(model_name: str, temperature: float, max_tokens: int) -> ChatOpenAI:
+    """Build (once per configuration) a ChatOpenAI wired to the shared client."""
+    return ChatOpenAI(
+        model=model_name,
+        temperature=temperature,
+        max_tokens=max_tokens,
+        openai_api_key=settings.openrouter_api_key,
+        openai_api_base=_OPENROUTER_BASE_URL,
+        default_headers=_DEFAULT_HEADERS,
+        http_async_client=_get_http_client(),
+    )
+
 
 class LLMFactory:
     """Factory for creating LLM instances with consistent configuration."""
-    
+
     @staticmethod
     def create_chat_model(
         model_name: str | None = None,
@@ -20,15 +74,15 @@ class LLMFactory:
     ) -> ChatOpenAI:
         """
         Create a ChatOpenAI instance configured for OpenRouter.
-        
+
         Args:
             model_name: Model identifier (e.g., "openai/gpt-4o"). Uses config default if None.
             temperature: Sampling temperature (0-2). Uses config default if None.
             max_tokens: Maximum tokens in response. Uses config default if None.
-            
+
         Returns:
-            Configured ChatOpenAI instance.
-            
+            Configured ChatOpenAI instance (cached per configuration).
+
         Raises:
             ValueError: If OPENROUTER_API_KEY is not configured
         """
@@ -37,17 +91,11 @@ class LLMFactory:
                 "OPENROUTER_API_KEY not configured. "
                 "Please set it in your .env file to use the LLM."
             )
-        
-        return ChatOpenAI(
-            model=model_name or settings.model_name,
-            temperature=temperature or settings.model_temperature,
-            max_tokens=max_tokens or settings.model_max_tokens,
-            openai_api_key=settings.openrouter_api_key,
-            openai_api_base="https://openrouter.ai/api/v1",
-            default_headers={
-                "HTTP-Referer": "https://github.com/yourusername/fastapi-langgraph-mcp-starter",
-                "X-Title": "FastAPI LangGraph MCP Starter",
-            },
+
+        return _cached_chat_model(
+            model_name or settings.model_name,
+            temperature if temperature is not None else settings.model_temperature,
+            max_tokens or settings.model_max_tokens,
         )
 
 
@@ -7,7 +7,13 @@ import json
 import logging
 import sys
 from datetime import datetime
-from typing import Any
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
+from typing import Any, Optional
+
+# Background listener draining the log queue; stdio writes happen on its
+# thread, never on the event loop
+_listener: Optional[QueueListener] = None
 
 
 class JSONFormatter(logging.Formatter):
@@ -47,21 +53,30 @@ class JSONFormatter(logging.Formatter):
 def setup_logging(log_level: str = "INFO", json_logs: bool = False) -> None:
     """
     Configure application logging.
-    
+
+    Records are handed to a QueueHandler and written by a background
+    QueueListener thread, so synchronous stdio writes never block the
+    asyncio event loop.
+
     Args:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         json_logs: If True, use JSON formatter; otherwise use standard formatter
     """
+    global _listener
+
     # Get root logger
     logger = logging.getLogger()
     logger.setLevel(getattr(logging, log_level.upper()))
-    
-    # Remove existing handlers
+
+    # Remove existing handlers (and stop a previous listener on re-setup)
     logger.handlers.clear()
-    
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
     # Create console handler
     handler = logging.StreamHandler(sys.stdout)
-    
+
     # Set formatter
     if json_logs:
         formatter = JSONFormatter()
@@ -69,9 +84,23 @@ def setup_logging(log_level: str = "INFO", json_logs: bool = False) -> None:
         formatter = logging.Formatter(
             "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
         )
-    
+
     handler.setFormatter(formatter)
-    logger.addHandler(handler)
+
+    # Non-blocking pipeline: root -> queue -> listener thread -> stdout
+    queue: SimpleQueue = SimpleQueue()
+    _listener = QueueListener(queue, handler, respect_handler_level=True)
+    _listener.start()
+    logger.addHandler(QueueHandler(queue))
+
+
+def shutdown_logging() -> None:
+    """Stop the background log listener, flushing queued records."""
+    global _listener
+
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
 
 
 def get_logger(name: str) -> logging.Logger:
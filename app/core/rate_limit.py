@@ -28,8 +28,12 @@ def get_api_key_identifier(request):
     return get_remote_address(request)
 
 
-# Create limiter instance
+# Create limiter instance. With REDIS_URL set, counters live in Redis and
+# are shared across workers; otherwise each worker keeps its own in-memory
+# counters (fine for a single process, too lax under multi-worker uvicorn).
 limiter = Limiter(
     key_func=get_api_key_identifier,
     default_limits=[f"{settings.rate_limit_per_minute}/minute"],
+    storage_uri=settings.redis_url or "memory://",
+    strategy="moving-window",
 )
@@ -5,23 +5,36 @@ Provides async database engine and session factory.
 
 from typing import AsyncGenerator
 
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
 from sqlmodel import SQLModel
 
 from app.config import settings
 
-# Create async engine
+# Create async engine with an explicit connection pool so sustained load
+# reuses warm connections instead of exhausting the default pool. Behind a
+# transaction-mode pgbouncer, server-side pooling replaces SQLAlchemy's, so
+# db_use_null_pool disables the client-side pool entirely.
+if settings.db_use_null_pool:
+    _pool_kwargs = {"poolclass": NullPool}
+else:
+    _pool_kwargs = {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_pre_ping": True,
+        "pool_recycle": settings.db_pool_recycle,
+    }
+
 engine = create_async_engine(
     settings.database_url,
     echo=settings.database_echo,
     future=True,
+    **_pool_kwargs,
 )
 
 # Create async session factory
-async_session_maker = sessionmaker(
+async_session_maker = async_sessionmaker(
     engine,
-    class_=AsyncSession,
     expire_on_commit=False,
 )
 
@@ -35,7 +48,7 @@ async def create_db_and_tables():
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
     """
     Dependency for getting async database session.
-    
+
     Yields:
         AsyncSession instance
     """
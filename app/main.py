@@ -1,19 +1,27 @@
 """Main FastAPI application entry point."""
 
+import logging
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, Request
+from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 
+from app.agent.checkpointer import close_checkpointer, create_checkpointer
+from app.agent.graph import create_agent_graph
 from app.api.routes import router
 from app.config import settings
-from app.core.logging import setup_logging
+from app.core.llm_factory import aclose_http_client
+from app.core.logging import setup_logging, shutdown_logging
 from app.core.rate_limit import limiter
 from app.core.tracing import setup_langsmith
-from app.db.session import create_db_and_tables
+from app.db.session import create_db_and_tables, engine
+from app.mcp.tools.weather import aclose_client as aclose_weather_client
+
+logger = logging.getLogger(__name__)
 
 
 @asynccontextmanager
@@ -24,18 +32,19 @@ async def lifespan(app: FastAPI):
     Handles startup and shutdown events, including checkpointer initialization.
     """
     # Startup
-    setup_logging()
+    setup_logging(settings.log_level, settings.json_logs)
     setup_langsmith()  # Now reads from settings directly
     
-    # Create database tables if they don't exist
-    await create_db_and_tables()
+    # Create database tables if they don't exist; deployments that run
+    # migrations out-of-band opt out via SKIP_SCHEMA_BOOTSTRAP
+    if not settings.skip_schema_bootstrap:
+        await create_db_and_tables()
     
     # Initialize MCP client manager
     from app.mcp.client import MCPClientManager
-    from app.config import settings as app_settings
-    
+
     try:
-        async with MCPClientManager(app_settings.mcp_servers_config) as mcp_manager:
+        async with MCPClientManager(settings.mcp_servers_config) as mcp_manager:
             # Store MCP manager in app state
             app.state.mcp_manager = mcp_manager
             
@@ -44,46 +53,51 @@ async def lifespan(app: FastAPI):
             total_tools = sum(len(tools) for tools in all_tools.values())
             enabled_servers = mcp_manager.get_enabled_servers()
             
-            print(f"✓ MCP Manager initialized")
-            print(f"  - {len(enabled_servers)} server(s) enabled: {', '.join(enabled_servers)}")
-            print(f"  - {total_tools} tool(s) available from external servers")
+            logger.info(
+                "MCP manager initialized: %d server(s) enabled (%s), %d external tool(s)",
+                len(enabled_servers),
+                ", ".join(enabled_servers),
+                total_tools,
+            )
             
             # Initialize PostgreSQL checkpointer for conversation memory
-            # Convert asyncpg URL to psycopg format (remove +asyncpg)
-            checkpointer_url = settings.database_url.replace('+asyncpg', '')
-            
-            # Use async context manager to manage connection lifecycle
-            async with AsyncPostgresSaver.from_conn_string(checkpointer_url) as checkpointer:
-                # Setup checkpoint tables
-                await checkpointer.setup()
-                
-                # Store checkpointer in app state for access in routes
-                app.state.checkpointer = checkpointer
-                
-                print(f"✓ Checkpointer initialized with PostgreSQL")
-                print(f"✓ Database: {checkpointer_url.split('@')[1] if '@' in checkpointer_url else 'configured'}")
-                
+            # (shared async connection pool, migrations applied once here)
+            app.state.checkpointer = await create_checkpointer()
+
+            # Compile the agent graph once; requests share the instance
+            app.state.agent_graph = create_agent_graph(checkpointer=app.state.checkpointer)
+
+            logger.info("Checkpointer initialized with PostgreSQL")
+
+            try:
                 yield
-                
-                # Cleanup happens automatically when exiting async contexts
-                print("Shutting down checkpointer...")
-            
-            print("Shutting down MCP manager...")
-    
+            finally:
+                logger.info("Shutting down checkpointer and shared clients")
+                await close_checkpointer()
+                await aclose_http_client()
+                await aclose_weather_client()
+                await engine.dispose()
+
+            logger.info("Shutting down MCP manager")
+
     except Exception as e:
-        print(f"Error initializing MCP manager: {e}")
-        print("Continuing with built-in tools only...")
-        
+        logger.error("Error initializing MCP manager: %s; continuing with built-in tools only", e)
+
         # Fallback: continue without MCP manager
         app.state.mcp_manager = None
-        
-        # Still initialize checkpointer
-        checkpointer_url = settings.database_url.replace('+asyncpg', '')
-        async with AsyncPostgresSaver.from_conn_string(checkpointer_url) as checkpointer:
-            await checkpointer.setup()
-            app.state.checkpointer = checkpointer
-            print(f"✓ Checkpointer initialized (fallback mode)")
+
+        # Still initialize checkpointer and the shared agent graph
+        app.state.checkpointer = await create_checkpointer()
+        app.state.agent_graph = create_agent_graph(checkpointer=app.state.checkpointer)
+        logger.info("Checkpointer initialized (fallback mode)")
+        try:
             yield
+        finally:
+            await close_checkpointer()
+            await aclose_http_client()
+            await aclose_weather_client()
+            await engine.dispose()
+    shutdown_logging()
 
 
 # Create FastAPI app
@@ -91,6 +105,7 @@ app = FastAPI(
     title="FastAPI + LangGraph + MCP Starter",
     description="Production-ready AI agent with FastAPI, LangGraph, and MCP",
     version="0.1.0",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan,
 )
 
@@ -107,18 +122,13 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger JSON responses; tiny payloads are cheaper uncompressed
+app.add_middleware(GZipMiddleware, minimum_size=512, compresslevel=5)
+
 # Include API routes
 app.include_router(router)
 
 
-@app.middleware("http")
-async def add_request_to_limiter(request: Request, call_next):
-    """Add request to rate limiter context."""
-    request.state.limiter = limiter
-    response = await call_next(request)
-    return response
-
-
 if __name__ == "__main__":
     import uvicorn
     
@@ -127,4 +137,8 @@ if __name__ == "__main__":
         host=settings.api_host,
         port=settings.api_port,
         reload=settings.api_reload,
+        loop="uvloop",
+        http="httptools",
+        log_level="info",
+        access_log=False,  # per-request access-log formatting is pure overhead
     )
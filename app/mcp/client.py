@@ -4,17 +4,28 @@ Manages connections to multiple MCP servers and aggregates their tools.
 """
 
 import asyncio
-import json
 import logging
 import os
+import re
+from contextlib import AsyncExitStack
 from pathlib import Path
 from typing import Any, Optional
 
+import orjson
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
 
 logger = logging.getLogger(__name__)
 
+# ${VAR} placeholder syntax in server env values
+_VAR_RE = re.compile(r"^\$\{([^}]+)\}$")
+
+
+def _resolve_env_value(value: str) -> str:
+    """Resolve a ${VAR} placeholder against the process environment."""
+    match = _VAR_RE.match(value)
+    return os.environ.get(match.group(1), "") if match else value
+
 
 class MCPServerConfig:
     """Configuration for a single MCP server."""
@@ -27,6 +38,10 @@ class MCPServerConfig:
         self.command = config.get("command")
         self.args = config.get("args", [])
         self.env = config.get("env", {})
+        # ${VAR} placeholders are resolved once here rather than per connect
+        self.resolved_env = {
+            key: _resolve_env_value(value) for key, value in self.env.items()
+        }
     
     def __repr__(self) -> str:
         return f"MCPServerConfig(name={self.name}, type={self.type}, enabled={self.enabled})"
@@ -46,24 +61,24 @@ class MCPClientManager:
         self.servers: dict[str, MCPServerConfig] = {}
         self.sessions: dict[str, ClientSession] = {}
         self.tools: dict[str, list[Any]] = {}  # server_name -> tools
-        
-        self._load_config()
-    
-    def _load_config(self) -> None:
-        """Load server configurations from JSON file."""
+        self._base_env: dict[str, str] = {}
+        self._stacks: dict[str, AsyncExitStack] = {}  # per-server transport/session contexts
+
+    async def _load_config(self) -> None:
+        """Load server configurations from JSON file without blocking the loop."""
         config_file = Path(self.config_path)
-        
+
         if not config_file.exists():
             logger.warning(f"MCP config file not found: {self.config_path}, using built-in only")
             self.servers = {
                 "local": MCPServerConfig("local", {"type": "builtin", "enabled": True})
             }
             return
-        
+
         try:
-            with open(config_file) as f:
-                config_data = json.load(f)
-            
+            raw = await asyncio.to_thread(config_file.read_bytes)
+            config_data = orjson.loads(raw)
+
             for name, server_config in config_data.get("servers", {}).items():
                 self.servers[name] = MCPServerConfig(name, server_config)
                 logger.info(f"Loaded MCP server config: {name} ({server_config.get('description', 'No description')})")
@@ -85,33 +100,39 @@ class MCPClientManager:
         await self.disconnect_all()
     
     async def connect_all(self) -> None:
-        """Connect to all enabled servers concurrently."""
-        tasks = []
-        
+        """Connect to all enabled servers.
+
+        Connects run sequentially in the manager's own task: the stdio
+        transport and session are anyio context managers whose cancel
+        scopes must be exited in the task that entered them, so entering
+        them from gather-spawned tasks would make disconnect_all blow up
+        with cross-task cancel-scope errors.
+        """
+        if not self.servers:
+            await self._load_config()
+
+        # Snapshot the process environment once; per-server connects only
+        # layer their own overrides on top of this shared base.
+        self._base_env = dict(os.environ)
+
         for name, config in self.servers.items():
             if not config.enabled:
                 logger.info(f"Skipping disabled server: {name}")
                 continue
-            
+
             if config.type == "builtin":
                 # Built-in server doesn't need connection
                 logger.info(f"✓ Built-in server '{name}' ready")
                 self.tools[name] = []  # Will be populated by agent nodes
                 continue
-            
+
             # Connect to external servers
-            tasks.append(self._connect_server(name, config))
-        
-        # Connect concurrently with timeout
-        if tasks:
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            
-            # Log results
-            for name, result in zip([n for n, c in self.servers.items() if c.enabled and c.type != "builtin"], results):
-                if isinstance(result, Exception):
-                    logger.error(f"Failed to connect to {name}: {result}")
-                else:
-                    logger.info(f"✓ Connected to MCP server '{name}'")
+            try:
+                await self._connect_server(name, config)
+            except Exception as e:
+                logger.error(f"Failed to connect to {name}: {e}")
+            else:
+                logger.info(f"✓ Connected to MCP server '{name}'")
     
     async def _connect_server(self, name: str, config: MCPServerConfig) -> None:
         """
@@ -122,16 +143,10 @@ class MCPClientManager:
             config: Server configuration
         """
         try:
-            # Prepare environment variables
-            env = os.environ.copy()
-            for key, value in config.env.items():
-                # Support ${VAR} substitution
-                if value.startswith("${") and value.endswith("}"):
-                    env_var = value[2:-1]
-                    env[key] = os.environ.get(env_var, "")
-                else:
-                    env[key] = value
-            
+            # Layer pre-resolved overrides on the shared base environment
+            env = {**self._base_env, **config.resolved_env}
+
+
             # Create server parameters
             server_params = StdioServerParameters(
                 command=config.command,
@@ -139,27 +154,31 @@ class MCPClientManager:
                 env=env
             )
             
-            # Connect with timeout
-            async with asyncio.timeout(30):
-                # Create stdio client
-                stdio_transport = await stdio_client(server_params)
-                
-                # Create session
-                read, write = stdio_transport
-                session = ClientSession(read, write)
-                
-                # Initialize session
-                await session.initialize()
-                
-                # List available tools
-                tools_result = await session.list_tools()
-                
-                # Store session and tools
-                self.sessions[name] = session
-                self.tools[name] = tools_result.tools if hasattr(tools_result, 'tools') else []
-                
-                logger.info(f"Server '{name}' has {len(self.tools[name])} tools")
-        
+            # Connect with timeout; the exit stack owns the stdio transport
+            # and session contexts so disconnect can tear them down cleanly
+            stack = AsyncExitStack()
+            try:
+                async with asyncio.timeout(30):
+                    read, write = await stack.enter_async_context(stdio_client(server_params))
+                    session = await stack.enter_async_context(ClientSession(read, write))
+
+                    # Initialize session
+                    await session.initialize()
+
+                    # List available tools
+                    tools_result = await session.list_tools()
+            except BaseException:
+                await stack.aclose()
+                raise
+
+            # Store session, tools, and cleanup stack
+            self.sessions[name] = session
+            self.tools[name] = tools_result.tools if hasattr(tools_result, 'tools') else []
+            self._stacks[name] = stack
+
+            logger.info(f"Server '{name}' has {len(self.tools[name])} tools")
+
+
         except asyncio.TimeoutError:
             logger.warning(f"Timeout connecting to server '{name}'")
             raise
@@ -168,14 +187,21 @@ class MCPClientManager:
             raise
     
     async def disconnect_all(self) -> None:
-        """Disconnect from all connected servers."""
-        for name, session in self.sessions.items():
+        """Disconnect from all connected servers.
+
+        Stacks close sequentially in this task — the same one that
+        entered the contexts in connect_all — because anyio cancel
+        scopes refuse to exit from a different task.
+        """
+        for name, stack in self._stacks.items():
             try:
-                # MCP sessions don't have explicit close, just let them cleanup
-                logger.info(f"Disconnected from server '{name}'")
+                await stack.aclose()
             except Exception as e:
                 logger.error(f"Error disconnecting from '{name}': {e}")
-        
+            else:
+                logger.info(f"Disconnected from server '{name}'")
+
+        self._stacks.clear()
         self.sessions.clear()
         self.tools.clear()
     
@@ -1,85 +1,169 @@
 """Calculator tool for MCP.
 
 Provides safe mathematical expression evaluation.
+
+Expressions are validated against a whitelist in a single AST walk,
+compiled to a code object cached by expression string, and evaluated
+with one C-level eval call — no recursive Python tree walk per call.
 """
 
 import ast
 import operator
+from functools import lru_cache
 from typing import Any
 
+# AST node types allowed in expressions (everything else is rejected)
+_ALLOWED_NODES = (
+    ast.Expression,
+    ast.Constant,
+    ast.BinOp,
+    ast.UnaryOp,
+    ast.Add,
+    ast.Sub,
+    ast.Mult,
+    ast.Div,
+    ast.Pow,
+    ast.USub,
+)
+
+# Eval namespace with builtins stripped
+_EVAL_GLOBALS = {"__builtins__": {}}
 
-# Supported operators
-OPERATORS = {
+# Binary operators used when folding constant subtrees
+_BIN_OPS = {
     ast.Add: operator.add,
     ast.Sub: operator.sub,
     ast.Mult: operator.mul,
     ast.Div: operator.truediv,
     ast.Pow: operator.pow,
-    ast.USub: operator.neg,
 }
 
 
-def _eval_expr(node: ast.expr) -> float:
+def _validate(tree: ast.AST) -> None:
+    """
+    Reject any AST node outside the arithmetic whitelist.
+
+    Args:
+        tree: Parsed expression AST.
+
+    Raises:
+        ValueError: If the expression contains unsupported operations.
+    """
+    for node in ast.walk(tree):
+        if not isinstance(node, _ALLOWED_NODES):
+            raise ValueError(f"Unsupported expression type: {type(node).__name__}")
+        if isinstance(node, ast.Constant) and not isinstance(node.value, (int, float)):
+            raise ValueError(f"Unsupported constant: {node.value!r}")
+
+
+def _fold(node: ast.expr) -> ast.expr:
     """
-    Safely evaluate an AST expression node.
-    
+    Collapse constant subtrees into a single ast.Constant.
+
+    With the arithmetic-only whitelist every valid expression folds to one
+    constant, so arithmetic errors surface here with the same messages the
+    eval path would raise.
+
     Args:
-        node: AST expression node to evaluate.
-        
+        node: Validated expression node.
+
     Returns:
-        Evaluated result as a float.
-        
+        Folded expression node.
+
     Raises:
-        ValueError: If expression contains unsupported operations.
+        ValueError: If folding hits an arithmetic error (e.g. division by zero).
     """
-    if isinstance(node, ast.Constant):
-        return float(node.value)
-    elif isinstance(node, ast.BinOp):
-        left = _eval_expr(node.left)
-        right = _eval_expr(node.right)
-        op = OPERATORS.get(type(node.op))
-        if op is None:
-            raise ValueError(f"Unsupported operator: {type(node.op).__name__}")
-        return op(left, right)
+    if isinstance(node, ast.BinOp):
+        left = _fold(node.left)
+        right = _fold(node.right)
+        if isinstance(left, ast.Constant) and isinstance(right, ast.Constant):
+            try:
+                # Float coercion keeps folding on IEEE semantics: a huge
+                # exponent overflows immediately instead of grinding
+                # through unbounded bignum arithmetic
+                value = _BIN_OPS[type(node.op)](float(left.value), float(right.value))
+            except ZeroDivisionError:
+                raise ValueError("Division by zero") from None
+            except Exception as e:
+                raise ValueError(f"Calculation error: {str(e)}") from None
+            return ast.copy_location(ast.Constant(value), node)
+        node.left, node.right = left, right
     elif isinstance(node, ast.UnaryOp):
-        operand = _eval_expr(node.operand)
-        op = OPERATORS.get(type(node.op))
-        if op is None:
-            raise ValueError(f"Unsupported unary operator: {type(node.op).__name__}")
-        return op(operand)
-    else:
-        raise ValueError(f"Unsupported expression type: {type(node).__name__}")
+        operand = _fold(node.operand)
+        if isinstance(operand, ast.Constant):
+            return ast.copy_location(ast.Constant(-float(operand.value)), node)
+        node.operand = operand
+    return node
 
 
-def calculate(expression: str) -> dict[str, Any]:
+@lru_cache(maxsize=1024)
+def _compile(expression: str):
     """
-    Safely evaluate a mathematical expression.
-    
-    Supports basic arithmetic operations: +, -, *, /, ^ (power)
-    
+    Parse, validate, and compile an expression, cached by string.
+
     Args:
-        expression: Mathematical expression to evaluate (e.g., "2 + 2", "10 * 5 - 3")
-        
+        expression: Mathematical expression to compile.
+
     Returns:
-        Dictionary with expression and result.
-        
+        Code object ready for eval.
+
     Raises:
         ValueError: If expression is invalid or contains unsupported operations.
     """
     try:
-        # Parse expression into AST
         tree = ast.parse(expression, mode='eval')
-        
-        # Evaluate the expression
-        result = _eval_expr(tree.body)
-        
-        return {
-            "expression": expression,
-            "result": result,
-        }
     except SyntaxError as e:
         raise ValueError(f"Invalid expression syntax: {str(e)}")
+
+    _validate(tree)
+    tree.body = _fold(tree.body)
+    ast.fix_missing_locations(tree)
+    return compile(tree, "<calc>", "eval")
+
+
+@lru_cache(maxsize=4096)
+def _evaluate(expression: str) -> float:
+    """
+    Evaluate an expression, caching the numeric result by string.
+
+    Args:
+        expression: Mathematical expression to evaluate.
+
+    Returns:
+        Evaluated result as a float.
+
+    Raises:
+        ValueError: If expression is invalid or evaluation fails.
+    """
+    code = _compile(expression)
+
+    try:
+        result = eval(code, _EVAL_GLOBALS, {})
     except ZeroDivisionError:
         raise ValueError("Division by zero")
     except Exception as e:
         raise ValueError(f"Calculation error: {str(e)}")
+
+    return float(result)
+
+
+def calculate(expression: str) -> dict[str, Any]:
+    """
+    Safely evaluate a mathematical expression.
+
+    Supports basic arithmetic operations: +, -, *, /, ^ (power)
+
+    Args:
+        expression: Mathematical expression to evaluate (e.g., "2 + 2", "10 * 5 - 3")
+
+    Returns:
+        Dictionary with expression and result.
+
+    Raises:
+        ValueError: If expression is invalid or contains unsupported operations.
+    """
+    # Fresh dict per call; only the immutable float result is shared
+    return {
+        "expression": expression,
+        "result": _evaluate(expression),
+    }
@@ -3,10 +3,9 @@
 Provides CRUD operations for TODO items with database persistence.
 """
 
-from datetime import datetime
 from typing import Any
 
-from sqlalchemy import select, update
+from sqlalchemy import delete, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models import Todo
@@ -72,21 +71,23 @@ async def complete_todo(todo_id: int, session: AsyncSession) -> dict[str, Any]:
     Raises:
         ValueError: If TODO with given ID doesn't exist
     """
-    result = await session.execute(select(Todo).where(Todo.id == todo_id))
-    todo = result.scalar_one_or_none()
-    
-    if not todo:
+    stmt = (
+        update(Todo)
+        .where(Todo.id == todo_id)
+        .values(completed=True, updated_at=func.now())
+        .returning(Todo.id, Todo.task, Todo.completed)
+    )
+    row = (await session.execute(stmt)).one_or_none()
+
+    if row is None:
         raise ValueError(f"TODO with id {todo_id} not found")
-    
-    todo.completed = True
-    todo.updated_at = datetime.utcnow()
+
     await session.commit()
-    await session.refresh(todo)
-    
+
     return {
-        "id": todo.id,
-        "task": todo.task,
-        "completed": todo.completed,
+        "id": row.id,
+        "task": row.task,
+        "completed": row.completed,
     }
 
 
@@ -126,13 +127,7 @@ async def clear_todos(session: AsyncSession) -> dict[str, str]:
     Returns:
         Success message
     """
-    await session.execute(update(Todo))
-    result = await session.execute(select(Todo))
-    todos = result.scalars().all()
-    
-    for todo in todos:
-        await session.delete(todo)
-    
+    await session.execute(delete(Todo))
     await session.commit()
-    
+
     return {"message": "All TODOs cleared"}
@@ -2,11 +2,16 @@
 
 This provides synchronous TODO operations for the LangGraph agent.
 For persistent database-backed TODOs, use app.mcp.tools.todo module directly.
+
+Storage is a dict keyed by id, so complete/delete are O(1) lookups and
+insertion order is preserved for listing (CPython >= 3.7 dict semantics).
 """
 
+import threading
 from typing import Any
 
-# In-memory storage
+# In-memory storage (guarded for threaded test clients)
+_lock = threading.Lock()
 _todos: dict[int, dict[str, Any]] = {}
 _next_id = 1
 
@@ -14,82 +19,88 @@ _next_id = 1
 def add_todo(task: str) -> dict[str, Any]:
     """
     Add a new TODO item.
-    
+
     Args:
         task: Description of the task
-        
+
     Returns:
         Created TODO with id, task, and completed status
     """
     global _next_id
-    
-    todo = {
-        "id": _next_id,
-        "task": task,
-        "completed": False,
-    }
-    _todos[_next_id] = todo
-    _next_id += 1
-    
-    return todo
+
+    with _lock:
+        todo_id = _next_id
+        _next_id += 1
+        todo = {"id": todo_id, "task": task, "completed": False}
+        _todos[todo_id] = todo
+
+    return dict(todo)
 
 
 def list_todos() -> list[dict[str, Any]]:
     """
     Get all TODO items.
-    
+
     Returns:
-        List of all TODOs
+        List of all TODOs in insertion order
     """
-    return list(_todos.values())
+    with _lock:
+        return [dict(todo) for todo in _todos.values()]
 
 
 def complete_todo(todo_id: int) -> dict[str, Any]:
     """
     Mark a TODO as completed.
-    
+
     Args:
         todo_id: ID of the TODO to complete
-        
+
     Returns:
         Updated TODO
-        
+
     Raises:
         ValueError: If TODO not found
     """
-    if todo_id not in _todos:
-        raise ValueError(f"TODO {todo_id} not found")
-    
-    _todos[todo_id]["completed"] = True
-    return _todos[todo_id]
+    with _lock:
+        todo = _todos.get(todo_id)
+        if todo is None:
+            raise ValueError(f"TODO {todo_id} not found")
+
+        todo["completed"] = True
+        return dict(todo)
 
 
 def delete_todo(todo_id: int) -> dict[str, str]:
     """
     Delete a TODO item.
-    
+
     Args:
         todo_id: ID of the TODO to delete
-        
+
     Returns:
         Success message
-        
+
     Raises:
         ValueError: If TODO not found
     """
-    if todo_id not in _todos:
-        raise ValueError(f"TODO {todo_id} not found")
-    
-    del _todos[todo_id]
-    return {"message": f"TODO {todo_id} deleted"}
+    with _lock:
+        if _todos.pop(todo_id, None) is None:
+            raise ValueError(f"TODO {todo_id} not found")
+
+    return {"message": f"TODO {todo_id} deleted successfully"}
 
 
 def clear_todos() -> dict[str, str]:
     """
     Clear all TODOs.
-    
+
     Returns:
         Success message
     """
-    _todos.clear()
+    global _next_id
+
+    with _lock:
+        _todos.clear()
+        _next_id = 1
+
     return {"message": "All TODOs cleared"}
@@ -1,58 +1,119 @@
 """Weather tool for MCP.
 
 Provides weather information using OpenWeatherMap API.
+
+All calls share one module-level httpx.AsyncClient so repeated weather
+lookups reuse a warm TCP/TLS connection instead of re-handshaking.
 """
 
+import time
+from typing import Any, Optional
+
+import asyncio
+
 import httpx
-from typing import Any
+import orjson
+
+from app.config import settings
+
+BASE_URL = "https://api.openweathermap.org/data/2.5/weather"
+
+# Bound concurrent upstream requests: a chat burst fanning out dozens of
+# simultaneous calls would trip OpenWeatherMap rate limits and queue
+# head-of-line behind the connection pool anyway
+_request_sem = asyncio.Semaphore(settings.weather_max_concurrency)
+
+# Successful lookups are cached briefly: weather doesn't change
+# per-second, and repeat city queries within a session are common.
+# Keyed on (city, api_key) with monotonic timestamps.
+_CACHE_TTL_SECONDS = 600.0
+_CACHE_MAX_ENTRIES = 1024
+_cache: dict[tuple[str, str], tuple[float, dict[str, Any]]] = {}
+
+# Shared HTTP client with keep-alive pooling
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """Get the shared HTTP client used for weather API calls."""
+    global _client
+
+    if _client is None:
+        _client = httpx.AsyncClient(
+            http2=True,
+            timeout=10.0,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+        )
+    return _client
+
+
+async def aclose_client() -> None:
+    """Close the shared weather HTTP client (called on app shutdown)."""
+    global _client
+
+    if _client is not None:
+        await _client.aclose()
+        _client = None
 
 
 async def get_weather(city: str, api_key: str) -> dict[str, Any]:
     """
     Get current weather for a city.
-    
+
     Args:
         city: City name (e.g., "London", "New York")
         api_key: OpenWeatherMap API key
-        
+
     Returns:
         Weather information including temperature, condition, humidity
-        
+
     Raises:
         ValueError: If API request fails or city not found
     """
-    base_url = "https://api.openweathermap.org/data/2.5/weather"
-    
+    cache_key = (city.strip().lower(), api_key)
+    cached = _cache.get(cache_key)
+    now = time.monotonic()
+    if cached is not None and now - cached[0] < _CACHE_TTL_SECONDS:
+        # Copy on hit so a caller mutating its payload can't corrupt
+        # the cached entry for the rest of the TTL window
+        return dict(cached[1])
+
     params = {
         "q": city,
         "appid": api_key,
         "units": "metric",  # Celsius
     }
-    
+
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(base_url, params=params, timeout=10.0)
-            
-            if response.status_code == 404:
-                raise ValueError(f"City '{city}' not found")
-            elif response.status_code == 401:
-                raise ValueError("Invalid API key")
-            elif response.status_code != 200:
-                raise ValueError(f"Weather API error: {response.status_code}")
-            
-            data = response.json()
-            
-            return {
-                "city": data["name"],
-                "country": data["sys"]["country"],
-                "temperature": data["main"]["temp"],
-                "feels_like": data["main"]["feels_like"],
-                "condition": data["weather"][0]["main"],
-                "description": data["weather"][0]["description"],
-                "humidity": data["main"]["humidity"],
-                "wind_speed": data["wind"]["speed"],
-            }
-    
+        async with _request_sem:
+            response = await get_client().get(BASE_URL, params=params)
+
+        if response.status_code == 404:
+            raise ValueError(f"City '{city}' not found")
+        elif response.status_code == 401:
+            raise ValueError("Invalid API key")
+        elif response.status_code != 200:
+            raise ValueError(f"Weather API error: {response.status_code}")
+
+        data = orjson.loads(response.content)
+
+        result = {
+            "city": data["name"],
+            "country": data["sys"]["country"],
+            "temperature": data["main"]["temp"],
+            "feels_like": data["main"]["feels_like"],
+            "condition": data["weather"][0]["main"],
+            "description": data["weather"][0]["description"],
+            "humidity": data["main"]["humidity"],
+            "wind_speed": data["wind"]["speed"],
+        }
+
+        if len(_cache) >= _CACHE_MAX_ENTRIES:
+            _cache.clear()  # simple bound; a full reset keeps memory flat
+        _cache[cache_key] = (now, result)
+
+        return dict(result)
+
     except httpx.TimeoutException:
         raise ValueError("Weather API request timed out")
     except httpx.RequestError as e:
@@ -1,17 +1,28 @@
 """Test configuration and fixtures."""
 
+import httpx
 import pytest
 from fastapi.testclient import TestClient
 
 from app.main import app
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def client():
-    """Create a test client for the FastAPI application."""
+    """Shared test client; TestClient is reentrant, so one instance
+    serves the whole session instead of being rebuilt per test."""
     return TestClient(app)
 
 
+@pytest.fixture
+async def async_client():
+    """In-process async client; requests run on the test's event loop
+    instead of TestClient's per-request worker thread."""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+        yield ac
+
+
 @pytest.fixture
 def sample_chat_request():
     """Sample chat request payload."""
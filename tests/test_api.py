@@ -1,7 +1,9 @@
 """Tests for API endpoints."""
 
 import pytest
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock
+
+from app.main import app
 
 
 def test_health_check(client):
@@ -15,9 +17,9 @@ def test_health_check(client):
 
 
 @pytest.mark.asyncio
-async def test_chat_endpoint_success(client):
+async def test_chat_endpoint_success(client, monkeypatch):
     """Test successful chat interaction."""
-    # Mock the agent graph to avoid actual LLM calls
+    # Inject a fake prebuilt graph into app state to avoid actual LLM calls
     mock_result = {
         "messages": [
             type('MockMessage', (), {
@@ -26,19 +28,20 @@ async def test_chat_endpoint_success(client):
             })()
         ]
     }
-    
-    with patch('app.api.routes.create_agent_graph') as mock_graph:
-        mock_graph.return_value.ainvoke = AsyncMock(return_value=mock_result)
-        
-        response = client.post(
-            "/chat",
-            json={"message": "Hello"}
-        )
-        
-        assert response.status_code == 200
-        data = response.json()
-        assert "response" in data
-        assert data["response"] == "Hello! How can I help you today?"
+
+    mock_graph = MagicMock()
+    mock_graph.ainvoke = AsyncMock(return_value=mock_result)
+    monkeypatch.setattr(app.state, "agent_graph", mock_graph, raising=False)
+
+    response = client.post(
+        "/chat",
+        json={"message": "Hello"}
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert "response" in data
+    assert data["response"] == "Hello! How can I help you today?"
 
 
 def test_chat_endpoint_validation(client):
@@ -1,15 +1,23 @@
 """Tests for MCP tools."""
 
+import asyncio
+
+import httpx
 import pytest
+import respx
 
-from app.mcp.tools import calculator, todo
+from app.config import settings
+from app.mcp.tools import calculator, weather
+from app.mcp.tools import todo_simple as todo
 
 
 class TestTodoTool:
     """Tests for TODO tool."""
     
-    def setup_method(self):
-        """Clear todos before each test."""
+    @pytest.fixture(autouse=True)
+    def _clean_todos(self):
+        """Leave an empty store behind each test instead of pre-clearing."""
+        yield
         todo.clear_todos()
     
     def test_add_todo(self):
@@ -100,17 +108,30 @@ class TestCalculatorTool:
         with pytest.raises(ValueError):
             calculator.calculate("2 +")
 
+    def test_huge_exponent_overflows(self):
+        """Large powers overflow as floats instead of grinding bignum math."""
+        with pytest.raises(ValueError, match="Calculation error"):
+            calculator.calculate("9 ** 9 ** 9")
+
+    def test_compilation_is_cached(self):
+        """Repeat expressions reuse the same compiled code object."""
+        assert calculator._compile("41 + 1") is calculator._compile("41 + 1")
+
 
 class TestWeatherTool:
     """Tests for weather tool."""
-    
+
+    @pytest.fixture(autouse=True)
+    def _clear_weather_cache(self):
+        """Weather lookups are TTL-cached; isolate tests from each other."""
+        weather._cache.clear()
+        yield
+        weather._cache.clear()
+
     @pytest.mark.asyncio
+    @respx.mock
     async def test_get_weather_success(self):
         """Test successful weather API call."""
-        from app.mcp.tools import weather
-        import httpx
-        from unittest.mock import AsyncMock, patch
-        
         mock_response = {
             "name": "London",
             "sys": {"country": "GB"},
@@ -124,44 +145,67 @@ class TestWeatherTool:
             ],
             "wind": {"speed": 5.5}
         }
-        
-        with patch('httpx.AsyncClient') as mock_client:
-            mock_get = AsyncMock()
-            mock_get.return_value.status_code = 200
-            mock_get.return_value.json.return_value = mock_response
-            mock_client.return_value.__aenter__.return_value.get = mock_get
-            
-            result = await weather.get_weather("London", "test_api_key")
-            
-            assert result["city"] == "London"
-            assert result["country"] == "GB"
-            assert result["temperature"] == 15.5
-            assert result["condition"] == "Clouds"
-    
+
+        respx.get(weather.BASE_URL).mock(
+            return_value=httpx.Response(200, json=mock_response)
+        )
+
+        result = await weather.get_weather("London", "test_api_key")
+
+        assert result["city"] == "London"
+        assert result["country"] == "GB"
+        assert result["temperature"] == 15.5
+        assert result["condition"] == "Clouds"
+
     @pytest.mark.asyncio
+    @respx.mock
     async def test_get_weather_city_not_found(self):
         """Test weather API with invalid city."""
-        from app.mcp.tools import weather
-        from unittest.mock import AsyncMock, patch
-        
-        with patch('httpx.AsyncClient') as mock_client:
-            mock_get = AsyncMock()
-            mock_get.return_value.status_code = 404
-            mock_client.return_value.__aenter__.return_value.get = mock_get
-            
-            with pytest.raises(ValueError, match="not found"):
-                await weather.get_weather("InvalidCity123", "test_api_key")
-    
+        respx.get(weather.BASE_URL).mock(return_value=httpx.Response(404))
+
+        with pytest.raises(ValueError, match="not found"):
+            await weather.get_weather("InvalidCity123", "test_api_key")
+
     @pytest.mark.asyncio
+    @respx.mock
     async def test_get_weather_invalid_api_key(self):
         """Test weather API with invalid API key."""
-        from app.mcp.tools import weather
-        from unittest.mock import AsyncMock, patch
-        
-        with patch('httpx.AsyncClient') as mock_client:
-            mock_get = AsyncMock()
-            mock_get.return_value.status_code = 401
-            mock_client.return_value.__aenter__.return_value.get = mock_get
-            
-            with pytest.raises(ValueError, match="Invalid API key"):
-                await weather.get_weather("London", "invalid_key")
+        respx.get(weather.BASE_URL).mock(return_value=httpx.Response(401))
+
+        with pytest.raises(ValueError, match="Invalid API key"):
+            await weather.get_weather("London", "invalid_key")
+
+    def test_client_is_module_scoped(self):
+        """All weather calls share one pooled AsyncClient instance."""
+        assert weather.get_client() is weather.get_client()
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_concurrent_requests_are_bounded(self):
+        """A fan-out of lookups never exceeds the configured request cap."""
+        payload = {
+            "name": "City",
+            "sys": {"country": "GB"},
+            "main": {"temp": 10.0, "feels_like": 9.0, "humidity": 50},
+            "weather": [{"main": "Clear", "description": "clear sky"}],
+            "wind": {"speed": 1.0},
+        }
+        in_flight = 0
+        max_in_flight = 0
+
+        async def slow_response(request):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(200, json=payload)
+
+        respx.get(weather.BASE_URL).mock(side_effect=slow_response)
+
+        # Distinct cities so the TTL cache can't absorb the fan-out
+        await asyncio.gather(
+            *(weather.get_weather(f"City{i}", "test_api_key") for i in range(32))
+        )
+
+        assert max_in_flight <= settings.weather_max_concurrency
@@ -1,65 +1,107 @@
 """Tests for streaming endpoints."""
 
+import inspect
+
+import orjson
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import MagicMock
+
+from langchain_core.messages import AIMessage, ToolMessage
+
+from app.api.streaming import stream_agent_response
+from app.main import app
+
+
+def _ai_msg(content, tool_calls=()):
+    """Real AIMessage for graph events; mocks would dodge the isinstance
+    checks (and MagicMock silently swallows a name kwarg)."""
+    return AIMessage(content=content, tool_calls=list(tool_calls))
+
+
+def _tool_msg(name, content, tool_call_id="call_1"):
+    """Real ToolMessage for graph events."""
+    return ToolMessage(content=content, name=name, tool_call_id=tool_call_id)
+
+
+def test_stream_agent_response_is_async_generator():
+    """Streaming must stay an async generator; a sync generator would make
+    Starlette offload every next() call to its thread pool."""
+    assert inspect.isasyncgenfunction(stream_agent_response)
 
 
 @pytest.mark.asyncio
-async def test_stream_endpoint_success(client):
-    """Test streaming endpoint with successful response."""
-    # Mock the agent graph
+async def test_stream_endpoint_success(async_client, monkeypatch):
+    """Test streaming endpoint with a two-tool-call agent turn."""
+    # Fake the agent graph: one turn emits two independent tool calls
     mock_event_1 = {
         "agent": {
             "messages": [
-                MagicMock(
-                    content="",
-                    tool_calls=[{"name": "add_todo", "args": {"task": "Test"}}]
+                _ai_msg(
+                    "",
+                    tool_calls=[
+                        {"name": "add_todo", "args": {"task": "Test"}, "id": "call_1"},
+                        {"name": "calculate", "args": {"expression": "2 + 2"}, "id": "call_2"},
+                    ],
                 )
             ]
         }
     }
-    
+
     mock_event_2 = {
         "tools": {
             "messages": [
-                MagicMock(name="add_todo", content='{"id": 1, "task": "Test"}')
+                _tool_msg("add_todo", '{"id": 1, "task": "Test"}', "call_1"),
+                _tool_msg("calculate", '{"result": 4.0}', "call_2"),
             ]
         }
     }
-    
-    mock_event_3 = {
-        "agent": {
-            "messages": [
-                MagicMock(content="I've added the task!", tool_calls=[])
-            ]
-        }
-    }
-    
-    async def mock_astream(input_data):
+
+    mock_event_3 = {"agent": {"messages": [_ai_msg("I've added the task!")]}}
+
+    async def mock_astream(input_data, config=None):
         yield mock_event_1
         yield mock_event_2
         yield mock_event_3
-    
-    with patch('app.api.routes.create_agent_graph') as mock_graph:
-        mock_graph_instance = MagicMock()
-        mock_graph_instance.astream = mock_astream
-        mock_graph.return_value = mock_graph_instance
-        
-        response = client.get("/chat/stream?message=Add todo: Test")
-        
+
+    mock_graph_instance = MagicMock()
+    mock_graph_instance.astream = mock_astream
+    monkeypatch.setattr(app.state, "agent_graph", mock_graph_instance, raising=False)
+
+    async with async_client.stream(
+        "GET", "/chat/stream?message=Add todo: Test"
+    ) as response:
         assert response.status_code == 200
         assert "text/event-stream" in response.headers.get("content-type", "")
 
+        chunks = [chunk async for chunk in response.aiter_bytes()]
+
+    # Frames arrive incrementally (the coalescer may batch several
+    # events per write, so chunk count <= event count)
+    assert chunks
+    assert b"data:" in chunks[0]
+
+    body = b"".join(chunks)
+    # Both tool results from the single tools event reach the stream
+    assert body.count(b"event: tool_call") == 2
+    assert body.count(b"event: tool_result") == 2
+    assert b"event: done" in body
 
-def test_stream_endpoint_missing_message(client):
+    # The data payload is orjson-encoded bytes, decodable as-is
+    first_data = body.split(b"data: ", 1)[1].split(b"\n", 1)[0]
+    assert orjson.loads(first_data) == {"name": "add_todo", "args": {"task": "Test"}}
+
+
+@pytest.mark.asyncio
+async def test_stream_endpoint_missing_message(async_client):
     """Test streaming endpoint with missing message parameter."""
-    response = client.get("/chat/stream")
-    
+    response = await async_client.get("/chat/stream")
+
     assert response.status_code == 422  # Validation error
 
 
-def test_stream_endpoint_empty_message(client):
+@pytest.mark.asyncio
+async def test_stream_endpoint_empty_message(async_client):
     """Test streaming endpoint with empty message."""
-    response = client.get("/chat/stream?message=")
-    
+    response = await async_client.get("/chat/stream?message=")
+
     assert response.status_code == 422  # Validation error